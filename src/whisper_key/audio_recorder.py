@@ -185,7 +185,7 @@ class AudioRecorder:
             print("   ✗ No audio data recorded!")
             return None
 
-        audio_array = np.concatenate(self.audio_data, axis=0)
+        audio_array = np.concatenate(self.audio_data, axis=0).reshape(-1)
 
         if self._needs_resampling():
             recording_rate = self._get_recording_sample_rate()
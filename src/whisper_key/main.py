@@ -101,8 +101,11 @@ def setup_whisper_engine(whisper_config, vad_manager, model_registry, log_transc
             model_key=whisper_config['model'],
             device=whisper_config['device'],
             compute_type=whisper_config['compute_type'],
+            cpu_threads=whisper_config.get('cpu_threads', 0),
             language=whisper_config['language'],
             beam_size=whisper_config['beam_size'],
+            adaptive_beam=whisper_config.get('adaptive_beam', False),
+            vad_filter=whisper_config.get('vad_filter', False),
             initial_prompt=whisper_config.get('initial_prompt', ''),
             hotwords=whisper_config.get('hotwords', []),
             vad_manager=vad_manager,
@@ -145,9 +148,10 @@ def setup_voice_commands(voice_commands_config, clipboard_manager, log_transcrip
         log_transcriptions=log_transcriptions
     )
 
-def setup_system_tray(tray_config, config_manager, state_manager, model_registry, console_config=None):
+def setup_system_tray(tray_config, config_manager, state_manager, model_registry, shutdown_event, console_config=None):
     return SystemTray(
         state_manager=state_manager,
+        shutdown_event=shutdown_event,
         tray_config=tray_config,
         config_manager=config_manager,
         model_registry=model_registry,
@@ -270,7 +274,7 @@ def main():
             voice_command_manager=voice_command_manager
         )
         audio_recorder = setup_audio_recorder(audio_config, state_manager, vad_manager, streaming_manager)
-        system_tray = setup_system_tray(tray_config, config_manager, state_manager, model_registry, console_config)
+        system_tray = setup_system_tray(tray_config, config_manager, state_manager, model_registry, shutdown_event, console_config)
         state_manager.attach_components(audio_recorder, system_tray)
         
         hotkey_listener = setup_hotkey_listener(hotkey_config, state_manager, voice_commands_config['enabled'])
@@ -2,8 +2,6 @@ import logging
 import os
 from typing import Optional
 
-from faster_whisper.utils import _MODELS
-
 
 class ModelRegistry:
     DEFAULT_CACHE_PREFIX = "models--Systran--faster-whisper-"
@@ -12,6 +10,7 @@ class ModelRegistry:
         self.whisper_models = {}
         self.streaming_models = {}
         self.logger = logging.getLogger(__name__)
+        self.hf_cache_path = self._resolve_hf_cache_path()
 
         if whisper_models_config:
             for key, config in whisper_models_config.items():
@@ -42,12 +41,15 @@ class ModelRegistry:
     def get_groups_ordered(self) -> list:
         return ["official", "custom"]
 
-    def get_hf_cache_path(self) -> str:
+    def _resolve_hf_cache_path(self) -> str:
         userprofile = os.environ.get('USERPROFILE')
         if userprofile:
             return os.path.join(userprofile, '.cache', 'huggingface', 'hub')
         return os.path.join(os.path.expanduser('~'), '.cache', 'huggingface', 'hub')
 
+    def get_hf_cache_path(self) -> str:
+        return self.hf_cache_path
+
     def is_model_cached(self, key: str) -> bool:
         model = self.get_model(key)
         if model and model.is_local_path:
@@ -146,6 +148,7 @@ class ModelDefinition:
         if "/" in self.source:
             return "models--" + self.source.replace("/", "--")
 
+        from faster_whisper.utils import _MODELS
         if self.source in _MODELS:
             repo = _MODELS[self.source]
             return "models--" + repo.replace("/", "--")
@@ -27,6 +27,9 @@ def getch():
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     return ch
 
+def lower_current_thread_priority():
+    pass
+
 def run_event_loop(shutdown_event):
     app = NSApplication.sharedApplication()
     while not shutdown_event.is_set():
@@ -1,5 +1,8 @@
+import ctypes
 import msvcrt
 
+THREAD_PRIORITY_BELOW_NORMAL = -1
+
 
 def setup():
     pass
@@ -10,3 +13,7 @@ def run_event_loop(shutdown_event):
 
 def getch():
     return msvcrt.getwch()
+
+def lower_current_thread_priority():
+    kernel32 = ctypes.windll.kernel32
+    kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_BELOW_NORMAL)
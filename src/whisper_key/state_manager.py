@@ -41,6 +41,7 @@ class StateManager:
         self.last_transcription = None
         self._pending_model_change = None
         self._pending_device_change = None
+        self._loading_model_key = None
         self._command_mode = False
         self._state_lock = threading.Lock()
         self._streaming_display_active = False
@@ -184,7 +185,7 @@ class StateManager:
                 self.audio_feedback.play_transcription_complete_sound()
             
         except Exception as e:
-            self.logger.error(f"Error in processing workflow: {e}")
+            self.logger.error("Error in processing workflow: %s", e)
             print(f"❌ Error processing recording: {e}")
         
         finally:
@@ -195,12 +196,12 @@ class StateManager:
 
             if pending_device:
                 device_id, device_name = pending_device
-                self.logger.info(f"Executing pending device change to: {device_name}")
+                self.logger.info("Executing pending device change to: %s", device_name)
                 self._execute_audio_device_change(device_id, device_name)
                 self._pending_device_change = None
 
             if pending_model:
-                self.logger.info(f"Executing pending model change to: {pending_model}")
+                self.logger.info("Executing pending model change to: %s", pending_model)
                 print(f"🔄 Processing complete, now switching to [{pending_model}] model...")
                 self._execute_model_change(pending_model)
                 self._pending_model_change = None
@@ -211,7 +212,7 @@ class StateManager:
     def _handle_command_transcription(self, text: str, use_auto_enter: bool = False):
         log_config = self.config_manager.get_logging_config()
         if log_config.get('log_transcriptions', False):
-            self.logger.info(f"Command mode transcription: '{text}'")
+            self.logger.info("Command mode transcription: '%s'", text)
         else:
             self.logger.info("Command mode transcription received")
 
@@ -247,7 +248,7 @@ class StateManager:
             self._transcription_pipeline(audio_data)
             
         except Exception as e:
-            self.logger.error(f"Manual test failed: {e}")
+            self.logger.error("Manual test failed: %s", e)
             print(f"❌ Test failed: {e}")
     
     def shutdown(self):        
@@ -255,19 +256,16 @@ class StateManager:
 
         if self.audio_recorder.get_recording_status():
             self.audio_recorder.stop_recording()
-        
+
         self.system_tray.stop()
     
     def set_model_loading(self, loading: bool):
         with self._state_lock:
-            old_state = self.is_model_loading
+            if self.is_model_loading == loading:
+                return
             self.is_model_loading = loading
-            
-            if old_state != loading:
-                if loading:
-                    self.system_tray.update_state("processing")
-                else:
-                    self.system_tray.update_state("idle")
+
+        self.system_tray.update_state("processing" if loading else "idle")
     
     def is_transcription_recording(self) -> bool:
         return self.audio_recorder.get_recording_status() and not self._command_mode
@@ -288,10 +286,10 @@ class StateManager:
                 return "idle"
     
     def request_model_change(self, new_model_key: str) -> bool:
-        current_state = self.get_current_state()
-        
         if new_model_key == self.whisper_engine.model_key:
             return True
+
+        current_state = self.get_current_state()
         
         if current_state == "model_loading":
             print("⏳ Model already loading, please wait...")
@@ -312,33 +310,35 @@ class StateManager:
             self._execute_model_change(new_model_key)
             return True
         
-        self.logger.warning(f"Unexpected state for model change: {current_state}")
+        self.logger.warning("Unexpected state for model change: %s", current_state)
         return False
     
     def update_transcription_mode(self, value):
         self.config_manager.update_user_setting('clipboard', 'auto_paste', value)
         self.clipboard_manager.update_auto_paste(value)
 
+    def _on_model_change_progress(self, message: str):
+        lowered = message.lower()
+        if "ready" in lowered or "already loaded" in lowered:
+            print(f"✅ Successfully switched to [{self._loading_model_key}] model")
+            self.set_model_loading(False)
+        elif "failed" in lowered:
+            print(f"❌ Failed to change model: {message}")
+            self.set_model_loading(False)
+        else:
+            print(f"🔄 {message}")
+            self.set_model_loading(True)
+
     def _execute_model_change(self, new_model_key: str):
-        def progress_callback(message: str):
-            if "ready" in message.lower() or "already loaded" in message.lower():
-                print(f"✅ Successfully switched to [{new_model_key}] model")
-                self.set_model_loading(False)
-            elif "failed" in message.lower():
-                print(f"❌ Failed to change model: {message}")
-                self.set_model_loading(False)
-            else:
-                print(f"🔄 {message}")
-                self.set_model_loading(True)
-        
         try:
             self.set_model_loading(True)
             print(f"🔄 Switching to [{new_model_key}] model...")
-            
-            self.whisper_engine.change_model(new_model_key, progress_callback)
+
+            self._loading_model_key = new_model_key
+            self.whisper_engine.change_model(new_model_key, self._on_model_change_progress)
             
         except Exception as e:
-            self.logger.error(f"Failed to initiate model change: {e}")
+            self.logger.error("Failed to initiate model change: %s", e)
             print(f"❌ Failed to change model: {e}")
             self.set_model_loading(False)
 
@@ -354,7 +354,7 @@ class StateManager:
             hostapis = sd.query_hostapis()
             devices = sd.query_devices()
         except Exception as e:
-            self.logger.error(f"Failed to query audio hosts: {e}")
+            self.logger.error("Failed to query audio hosts: %s", e)
             return []
 
         hosts_with_input = {}
@@ -389,7 +389,7 @@ class StateManager:
         host_entry = normalized_lookup.get(host_name.lower())
 
         if not host_entry:
-            self.logger.warning(f"Requested audio host '{host_name}' is not available")
+            self.logger.warning("Requested audio host '%s' is not available", host_name)
             return False
 
         canonical_name = host_entry['name']
@@ -398,18 +398,18 @@ class StateManager:
 
         self._current_audio_host = canonical_name
         self.config_manager.update_audio_host(canonical_name)
-        self.logger.info(f"Audio host changed to {canonical_name}")
+        self.logger.info("Audio host changed to %s", canonical_name)
 
         self._ensure_audio_device_for_host(canonical_name)
         self.system_tray.refresh_menu()
         return True
 
     def request_audio_device_change(self, device_id: int, device_name: str):
-        current_state = self.get_current_state()
-
         if device_id == self.audio_recorder.device:
             return True
 
+        current_state = self.get_current_state()
+
         if current_state == "recording":
             print(f"🎤 Cancelling recording to switch audio device...")
             self.cancel_active_recording()
@@ -425,7 +425,7 @@ class StateManager:
             self._execute_audio_device_change(device_id, device_name)
             return True
 
-        self.logger.warning(f"Unexpected state for device change: {current_state}")
+        self.logger.warning("Unexpected state for device change: %s", current_state)
         return False
 
     def _execute_audio_device_change(self, device_id: int, device_name: str):
@@ -455,9 +455,10 @@ class StateManager:
             self.audio_recorder = new_recorder
 
             print(f"✅ Successfully switched audio device to: {device_name}")
+            self.system_tray.refresh_menu()
 
         except Exception as e:
-            self.logger.error(f"Failed to change audio device: {e}")
+            self.logger.error("Failed to change audio device: %s", e)
             print(f"❌ Failed to switch audio device: {e}")
 
     def _initialize_audio_host(self):
@@ -509,7 +510,7 @@ class StateManager:
         try:
             current_device_id = self.audio_recorder.get_device_id()
         except Exception as e:
-            self.logger.error(f"Unable to read current audio device: {e}")
+            self.logger.error("Unable to read current audio device: %s", e)
             return
 
         if self._device_matches_host(current_device_id, host_name):
@@ -517,14 +518,14 @@ class StateManager:
 
         fallback_device_id = self._get_default_device_for_host(host_name)
         if fallback_device_id is None:
-            self.logger.warning(f"No input devices available for host {host_name}")
+            self.logger.warning("No input devices available for host %s", host_name)
             return
 
         device_name = self._get_device_name(fallback_device_id)
         success = self.request_audio_device_change(fallback_device_id, device_name)
 
         if not success:
-            self.logger.warning(f"Failed to switch to fallback device {fallback_device_id} for host {host_name}")
+            self.logger.warning("Failed to switch to fallback device %s for host %s", fallback_device_id, host_name)
 
     def _device_matches_host(self, device_id: int, host_name: str) -> bool:
         try:
@@ -558,7 +559,7 @@ class StateManager:
                 if device['hostapi'] == target_index and device.get('max_input_channels', 0) > 0:
                     return idx
         except Exception as e:
-            self.logger.error(f"Failed to determine default device for host {host_name}: {e}")
+            self.logger.error("Failed to determine default device for host %s: %s", host_name, e)
 
         return None
 
@@ -1,28 +1,51 @@
+import io
 import logging
 import os
-import signal
+import threading
+import time
 from typing import Optional, TYPE_CHECKING
-from pathlib import Path
 
 from .utils import open_file
-from .platform import permissions, icons, console
-
-try:
-    import pystray
-    from PIL import Image
-    TRAY_AVAILABLE = True
-except ImportError:
-    TRAY_AVAILABLE = False
-    pystray = None
-    Image = None
+from .platform import permissions, icons, console, app
+
+pystray = None
+Image = None
+
+FALLBACK_ICON_COLORS = {
+    'idle': (128, 128, 128),      # Gray
+    'recording': (34, 139, 34),   # Green
+    'processing': (255, 165, 0)   # Orange
+}
+
+TRAY_ICON_FILES = {
+    "idle": "tray_idle.png",
+    "recording": "tray_recording.png",
+    "processing": "tray_processing.png",
+}
+
+def _import_tray_modules() -> bool:
+    global pystray, Image
+    if pystray is None:
+        try:
+            import pystray as pystray_module
+            from PIL import Image as image_module
+        except ImportError:
+            return False
+        pystray, Image = pystray_module, image_module
+    return True
 
 if TYPE_CHECKING:
     from .state_manager import StateManager
     from .config_manager import ConfigManager
 
 class SystemTray:
+    STATE_UPDATE_DEBOUNCE = 0.05
+    STATE_UPDATE_INTERVAL = 0.1
+    _fallback_icons = {}
+
     def __init__(self,
                  state_manager: 'StateManager',
+                 shutdown_event: threading.Event,
                  tray_config: dict = None,
                  config_manager: Optional['ConfigManager'] = None,
                  model_registry = None,
@@ -33,11 +56,20 @@ class SystemTray:
         self.config_manager = config_manager
         self.model_registry = model_registry
         self.console_config = console_config or {}
+        self.shutdown_event = shutdown_event
         self.logger = logging.getLogger(__name__)
                
         self.icon = None  # pystray object, holds menu, state, etc.
         self.is_running = False
         self.current_state = "idle"
+        self._model_loading = False
+        self._menu_cache = {}
+        self._static_menu_items = None
+        self._pending_lock = threading.Lock()
+        self._pending_state = None
+        self._menu_rebuild_pending = False
+        self._update_requested = threading.Event()
+        self._update_thread = None
         self.available = True
         
         if self._check_tray_availability():
@@ -48,7 +80,7 @@ class SystemTray:
             self.logger.warning("   ✗ System tray disabled in configuration")
             self.available = False
 
-        elif not TRAY_AVAILABLE:
+        elif not _import_tray_modules():
             self.logger.warning("   ✗ System tray not available - pystray or Pillow not installed")
             self.available = False
 
@@ -56,28 +88,32 @@ class SystemTray:
 
     def _load_icons_to_cache(self):
         try:
-            self.icons = icons.get_tray_icons()
+            self.icons = {state: self._load_icon(filename) for state, filename in TRAY_ICON_FILES.items()}
         except Exception as e:
-            self.logger.error(f"Failed to load tray icons: {e}")
+            self.logger.error("Failed to load tray icons: %s", e)
             self.icons = {
                 "idle": self._create_fallback_icon("idle"),
                 "recording": self._create_fallback_icon("recording"),
                 "processing": self._create_fallback_icon("processing"),
             }
         
-    def _create_fallback_icon(self, state: str) -> Image.Image:
-        colors = {
-            'idle': (128, 128, 128),      # Gray
-            'recording': (34, 139, 34),   # Green  
-            'processing': (255, 165, 0)   # Orange
-        }
-        
-        color = colors.get(state, (128, 128, 128))  # Default to gray
-        icon = Image.new('RGBA', (16, 16), color + (255,))
-
-        return icon
+    def _load_icon(self, filename: str) -> "Image.Image":
+        image = Image.open(io.BytesIO((icons.ASSETS_DIR / filename).read_bytes()))
+        image.load()
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        return image
+
+    @classmethod
+    def _create_fallback_icon(cls, state: str) -> "Image.Image":
+        if not cls._fallback_icons:
+            cls._fallback_icons = {
+                icon_state: Image.new('RGBA', (16, 16), color + (255,))
+                for icon_state, color in FALLBACK_ICON_COLORS.items()
+            }
+        return cls._fallback_icons.get(state, cls._fallback_icons['idle'])
     
-    def _build_model_menu_items(self, current_model: str, is_model_loading: bool) -> list:
+    def _build_model_menu_items(self, current_model: str) -> list:
         items = []
 
         if not self.model_registry:
@@ -90,7 +126,7 @@ class SystemTray:
             return lambda item: model_key == current_model
 
         def model_selection_enabled(item):
-            return not is_model_loading
+            return not self._model_loading
 
         first_group = True
         for group in self.model_registry.get_groups_ordered():
@@ -113,119 +149,139 @@ class SystemTray:
 
         return items
 
+    def _is_model_loading(self) -> bool:
+        return self.state_manager.get_application_state().get('model_loading', False)
+
     def _create_menu(self):
         try:
-            app_state = self.state_manager.get_application_state()
-            is_model_loading = app_state.get('model_loading', False)
-
-            auto_paste_enabled = self.config_manager.get_setting('clipboard', 'auto_paste')
-            current_model = self.config_manager.get_setting('whisper', 'model')
-
-            available_hosts = self.state_manager.get_available_audio_hosts()
-            current_host = self.state_manager.get_current_audio_host()
-
-            def is_current_host(host_name):
-                return lambda item: current_host == host_name
-
-            def switch_host(host_name):
-                return lambda icon, item: self._select_audio_host(host_name)
-
-            audio_host_items = []
-            if available_hosts:
-                for host in available_hosts:
-                    host_name = host['name']
-                    audio_host_items.append(
-                        pystray.MenuItem(
-                            host_name,
-                            switch_host(host_name),
-                            radio=True,
-                            checked=is_current_host(host_name)
-                        )
-                    )
-
-            available_devices = self.state_manager.get_available_audio_devices(current_host)
-            current_device = self.state_manager.get_current_audio_device_id()
-
-            def is_current_device(dev_id):
-                return lambda item: current_device == dev_id
-
-            def switch_device(dev_id, dev_name):
-                return lambda icon, item: self._select_audio_device(dev_id, dev_name)
-
-            audio_device_items = []
-
-            if available_devices:
-                for device in available_devices:
-                    device_id = device['id']
-                    device_name = device['name']
-
-                    audio_device_items.append(
-                        pystray.MenuItem(
-                            device_name,
-                            switch_device(device_id, device['name']),
-                            radio=True,
-                            checked=is_current_device(device_id)
-                        )
-                    )
+            menu_key = (
+                self.config_manager.get_setting('clipboard', 'auto_paste'),
+                self.config_manager.get_setting('whisper', 'model'),
+                self.state_manager.get_current_audio_host(),
+                self.state_manager.get_current_audio_device_id(),
+                self.config_manager.get_setting('voice_commands', 'enabled'),
+            )
 
-            model_sub_menu_items = self._build_model_menu_items(current_model, is_model_loading)
+            menu = self._menu_cache.get(menu_key)
+            if menu is None:
+                menu = self._build_menu(*menu_key)
+                self._menu_cache[menu_key] = menu
 
-            voice_commands_enabled = self.config_manager.get_setting('voice_commands', 'enabled')
+            return menu
 
-            menu_items = []
+        except Exception as e:
+            self.logger.error("Error in _create_menu: %s", e)
+            raise
 
+    def _get_static_menu_items(self):
+        if self._static_menu_items is None:
+            header = []
             if console.owns_console():
-                menu_items.append(pystray.MenuItem("Show Console", self._show_console, default=True))
-                menu_items.append(pystray.Menu.SEPARATOR)
-
-            menu_items += [
+                header.append(pystray.MenuItem("Show Console", self._show_console, default=True))
+                header.append(pystray.Menu.SEPARATOR)
+            header += [
                 pystray.MenuItem("Open log file...", self._open_log_file),
                 pystray.MenuItem("Open model cache...", self._open_model_cache),
                 pystray.Menu.SEPARATOR,
                 pystray.MenuItem("Open config folder...", self._open_config_folder),
                 pystray.MenuItem("Open settings file...", self._open_config_file),
-                pystray.MenuItem("Open commands file...", self._open_commands_file) if voice_commands_enabled else None,
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem(
-                    "Audio Host",
-                    pystray.Menu(*audio_host_items)
-                ) if audio_host_items else None,
-                pystray.MenuItem(
-                    f"Audio Source",
-                    pystray.Menu(*audio_device_items)
-                ),
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem("Auto-paste", lambda icon, item: self._set_transcription_mode(True), radio=True, checked=lambda item: auto_paste_enabled),
-                pystray.MenuItem("Copy to clipboard", lambda icon, item: self._set_transcription_mode(False), radio=True, checked=lambda item: not auto_paste_enabled),
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem(f"Model: {current_model.title()}", pystray.Menu(*model_sub_menu_items)),
             ]
+            self._static_menu_items = {
+                'header': tuple(header),
+                'open_commands': pystray.MenuItem("Open commands file...", self._open_commands_file),
+                'footer': (
+                    pystray.Menu.SEPARATOR,
+                    pystray.MenuItem("Exit", self._quit_application_from_tray),
+                ),
+            }
+        return self._static_menu_items
+
+    def _build_menu(self, auto_paste_enabled, current_model,
+                    current_host, current_device, voice_commands_enabled):
+        available_hosts = self.state_manager.get_available_audio_hosts()
+
+        def is_current_host(host_name):
+            return lambda item: current_host == host_name
+
+        def switch_host(host_name):
+            return lambda icon, item: self._select_audio_host(host_name)
+
+        audio_host_items = []
+        if available_hosts:
+            for host in available_hosts:
+                host_name = host['name']
+                audio_host_items.append(
+                    pystray.MenuItem(
+                        host_name,
+                        switch_host(host_name),
+                        radio=True,
+                        checked=is_current_host(host_name)
+                    )
+                )
 
-            menu_items.extend([
-                pystray.Menu.SEPARATOR,
-                pystray.MenuItem("Exit", self._quit_application_from_tray)
-            ])
+        available_devices = self.state_manager.get_available_audio_devices(current_host)
 
-            menu = pystray.Menu(*[item for item in menu_items if item is not None])
+        def is_current_device(dev_id):
+            return lambda item: current_device == dev_id
 
-            return menu 
-                
-        except Exception as e:
-            self.logger.error(f"Error in _create_menu: {e}")
-            raise
+        def switch_device(dev_id, dev_name):
+            return lambda icon, item: self._select_audio_device(dev_id, dev_name)
+
+        audio_device_items = []
+
+        if available_devices:
+            for device in available_devices:
+                device_id = device['id']
+                device_name = device['name']
+
+                audio_device_items.append(
+                    pystray.MenuItem(
+                        device_name,
+                        switch_device(device_id, device['name']),
+                        radio=True,
+                        checked=is_current_device(device_id)
+                    )
+                )
+
+        model_sub_menu_items = self._build_model_menu_items(current_model)
+
+        static_items = self._get_static_menu_items()
+
+        menu_items = list(static_items['header'])
+        menu_items += [
+            static_items['open_commands'] if voice_commands_enabled else None,
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem(
+                "Audio Host",
+                pystray.Menu(*audio_host_items)
+            ) if audio_host_items else None,
+            pystray.MenuItem(
+                f"Audio Source",
+                pystray.Menu(*audio_device_items)
+            ),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("Auto-paste", lambda icon, item: self._set_transcription_mode(True), radio=True, checked=lambda item: auto_paste_enabled),
+            pystray.MenuItem("Copy to clipboard", lambda icon, item: self._set_transcription_mode(False), radio=True, checked=lambda item: not auto_paste_enabled),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem(f"Model: {current_model.title()}", pystray.Menu(*model_sub_menu_items)),
+        ]
+
+        menu_items += static_items['footer']
+
+        return pystray.Menu(*[item for item in menu_items if item is not None])
 
     def _open_config_folder(self, icon=None, item=None):
         try:
             config_dir = os.path.dirname(self.config_manager.user_settings_path)
             open_file(config_dir)
         except Exception as e:
-            self.logger.error(f"Failed to open config folder: {e}")
+            self.logger.error("Failed to open config folder: %s", e)
 
     def _open_config_file(self, icon=None, item=None):
         try:
             open_file(self.config_manager.user_settings_path)
         except Exception as e:
-            self.logger.error(f"Failed to open config file: {e}")
+            self.logger.error("Failed to open config file: %s", e)
 
     def _open_commands_file(self, icon=None, item=None):
         try:
@@ -235,14 +291,14 @@ class SystemTray:
             )
             open_file(commands_path)
         except Exception as e:
-            self.logger.error(f"Failed to open commands file: {e}")
+            self.logger.error("Failed to open commands file: %s", e)
 
     def _open_log_file(self, icon=None, item=None):
         try:
             log_path = self.config_manager.get_log_file_path()
             open_file(log_path)
         except Exception as e:
-            self.logger.error(f"Failed to open log file: {e}")
+            self.logger.error("Failed to open log file: %s", e)
 
     def _open_model_cache(self, icon=None, item=None):
         try:
@@ -250,9 +306,12 @@ class SystemTray:
             os.makedirs(cache_path, exist_ok=True)
             open_file(cache_path)
         except Exception as e:
-            self.logger.error(f"Failed to open model cache: {e}")
+            self.logger.error("Failed to open model cache: %s", e)
 
     def _set_transcription_mode(self, auto_paste: bool):
+        if auto_paste == self.config_manager.get_setting('clipboard', 'auto_paste'):
+            return
+
         if auto_paste:
             if not permissions.check_accessibility_permission():
                 if not permissions.handle_missing_permission(self.config_manager):
@@ -260,7 +319,7 @@ class SystemTray:
                 auto_paste = False
 
         self.state_manager.update_transcription_mode(auto_paste)
-        self.icon.menu = self._create_menu()
+        self._request_menu_rebuild()
 
     def _select_model(self, model_key: str):
         try:
@@ -268,31 +327,31 @@ class SystemTray:
 
             if success:
                 self.config_manager.update_user_setting('whisper', 'model', model_key)
-                self.icon.menu = self._create_menu()
+                self._request_menu_rebuild()
             else:
-                self.logger.warning(f"Request to change model to {model_key} was not accepted")
+                self.logger.warning("Request to change model to %s was not accepted", model_key)
 
         except Exception as e:
-            self.logger.error(f"Error selecting model {model_key}: {e}")
+            self.logger.error("Error selecting model %s: %s", model_key, e)
 
     def _select_audio_host(self, host_name: str):
         try:
             success = self.state_manager.set_audio_host(host_name)
             if success:
-                self.icon.menu = self._create_menu()
+                self._request_menu_rebuild()
             else:
-                self.logger.warning(f"Request to change audio host to {host_name} was not accepted")
+                self.logger.warning("Request to change audio host to %s was not accepted", host_name)
         except Exception as e:
-            self.logger.error(f"Error selecting audio host {host_name}: {e}")
+            self.logger.error("Error selecting audio host %s: %s", host_name, e)
 
     def _select_audio_device(self, device_id: int, device_name: str):
         success = self.state_manager.request_audio_device_change(device_id, device_name)
 
         if success:
             self.config_manager.update_user_setting('audio', 'input_device', device_id)
-            self.icon.menu = self._create_menu()
+            self._request_menu_rebuild()
         else:
-            self.logger.warning(f"Request to change audio device to {device_id} was not accepted")
+            self.logger.warning("Request to change audio device to %s was not accepted", device_id)
 
     def _show_console(self, icon=None, item=None):
         console.show()
@@ -304,30 +363,69 @@ class SystemTray:
             console.hide()
         console.start_minimize_monitor(console.hide)
 
-    def _quit_application_from_tray(self, icon=None, item=None):        
-        os.kill(os.getpid(), signal.SIGINT)
+    def _quit_application_from_tray(self, icon=None, item=None):
+        self.stop()
+        self.shutdown_event.set()
     
     def update_state(self, new_state: str):
-        if not TRAY_AVAILABLE or not self.is_running:
+        if not self.is_running:
             return
-        
-        self.current_state = new_state
-        
-        try:
-            self.icon.icon = self.icons[new_state]
-            self.icon.menu = self._create_menu()
-        except Exception as e:
-            self.logger.error(f"Failed to update tray icon: {e}")
+
+        with self._pending_lock:
+            self._pending_state = new_state
+            self._update_requested.set()
 
     def refresh_menu(self):
-        if not self.icon:
+        if not self.is_running:
             return
 
+        self._menu_cache.clear()
+        self._request_menu_rebuild()
+
+    def _request_menu_rebuild(self):
+        with self._pending_lock:
+            self._menu_rebuild_pending = True
+            self._update_requested.set()
+
+    def _take_pending_updates(self):
+        with self._pending_lock:
+            self._update_requested.clear()
+            new_state, self._pending_state = self._pending_state, None
+            rebuild_menu, self._menu_rebuild_pending = self._menu_rebuild_pending, False
+        return new_state, rebuild_menu
+
+    def _process_state_updates(self):
+        app.lower_current_thread_priority()
+        last_applied = 0.0
+        while True:
+            self._update_requested.wait()
+            if not self.is_running:
+                return
+
+            remaining = self.STATE_UPDATE_INTERVAL - (time.monotonic() - last_applied)
+            time.sleep(max(self.STATE_UPDATE_DEBOUNCE, remaining))
+            if not self.is_running:
+                return
+
+            self._apply_updates(*self._take_pending_updates())
+            last_applied = time.monotonic()
+
+    def _apply_updates(self, new_state: Optional[str], rebuild_menu: bool):
         try:
-            self.icon.menu = self._create_menu()
+            if new_state is not None and new_state != self.current_state:
+                self.icon.icon = self.icons[new_state]
+                self.current_state = new_state
+
+            model_loading = self._is_model_loading()
+            if rebuild_menu:
+                self._model_loading = model_loading
+                self.icon.menu = self._create_menu()
+            elif model_loading != self._model_loading:
+                self._model_loading = model_loading
+                self.icon.update_menu()
         except Exception as e:
-            self.logger.error(f"Failed to refresh tray menu: {e}")
-    
+            self.logger.error("Failed to update tray: %s", e)
+
     def start(self):
         if not self.available:
             return False
@@ -350,12 +448,14 @@ class SystemTray:
             self.icon.run_detached()
 
             self.is_running = True
+            self._update_thread = threading.Thread(target=self._process_state_updates, daemon=True)
+            self._update_thread.start()
             print("   ✓ System tray icon is running...")
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to start system tray: {e}")
+            self.logger.error("Failed to start system tray: %s", e)
             return False
     
     def stop(self):
@@ -363,8 +463,10 @@ class SystemTray:
             return
 
         try:
-            self.icon.stop()
             self.is_running = False
+            self._update_requested.set()
+            self.icon.stop()
+            self._menu_cache.clear()
 
         except Exception as e:
-            self.logger.error(f"Error stopping system tray: {e}")
+            self.logger.error("Error stopping system tray: %s", e)
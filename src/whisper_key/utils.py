@@ -1,3 +1,4 @@
+import functools
 import os
 import subprocess
 import sys
@@ -5,24 +6,29 @@ import importlib.resources
 import tomllib
 from pathlib import Path
 
+_MISSING = object()
+
 class OptionalComponent:
     def __init__(self, component):
         self._component = component
     
+    @staticmethod
+    def _noop(*args, **kwargs):
+        return None
+
     def __getattr__(self, name):
-        if self._component and hasattr(self._component, name):
-            attr = getattr(self._component, name)
-            return attr
-        else:
+        attr = getattr(self._component, name, _MISSING) if self._component else _MISSING
+        if attr is _MISSING:
             # Return a no-op function for missing methods/attributes
-            return lambda *args, **kwargs: None
+            attr = self._noop
+        if callable(attr):
+            self.__dict__[name] = attr
+        return attr
 
 
+@functools.lru_cache(maxsize=32)
 def beautify_hotkey(hotkey_string: str) -> str:
-    if not hotkey_string:
-        return ""
-
-    return hotkey_string.replace('+', '+').upper()
+    return hotkey_string.upper() if hotkey_string else ""
 
 def parse_hotkey(hotkey_string: str) -> list:
     if not hotkey_string:
@@ -43,6 +49,7 @@ def open_file(path):
     from .platform import paths
     paths.open_file(path)
 
+@functools.lru_cache(maxsize=None)
 def resolve_asset_path(relative_path: str) -> str:
     if not relative_path or os.path.isabs(relative_path):
         return relative_path
@@ -6,16 +6,10 @@ from enum import Enum
 from typing import Optional, Callable
 import numpy as np
 
-try:
-    from ten_vad import TenVad
-    HAS_TEN_VAD = True
-except ImportError:
-    TenVad = None
-    HAS_TEN_VAD = False
-
 SAMPLE_RATE = 16000  # Fixed 16kHz sample rate for TEN VAD and Whisper
 VAD_HOP_DURATION_SEC = 0.016  # Fixed 256 samples at 16kHz
 VAD_CHUNK_SIZE = 256
+SILENCE_PEAK_THRESHOLD = 0.001  # Float32 peak below -60 dBFS is treated as silence
 
 def convert_audio_for_ten_vad(audio_data: np.ndarray) -> np.ndarray:
     # Flatten audio (TEN VAD expects 1D array)
@@ -63,21 +57,31 @@ class VadManager:
         self.ten_vad = self._check_and_init_ten_vad()
 
     def _check_and_init_ten_vad(self):
-        if (self.vad_precheck_enabled or self.vad_realtime_enabled) and HAS_TEN_VAD:
-            ten_vad = TenVad()
-            self.logger.info("TEN VAD initialized for speech detection")
-            return ten_vad
-        elif (self.vad_precheck_enabled or self.vad_realtime_enabled) and not HAS_TEN_VAD:
-            self.logger.warning("VAD enabled but ten-vad not available. VAD will be disabled.")
+        if not (self.vad_precheck_enabled or self.vad_realtime_enabled):
             return None
-        else:
+
+        try:
+            from ten_vad import TenVad
+        except ImportError:
+            self.logger.warning("VAD enabled but ten-vad not available. VAD will be disabled.")
             return None
 
+        ten_vad = TenVad()
+        self.logger.info("TEN VAD initialized for speech detection")
+        return ten_vad
+
     def check_audio_for_speech(self, audio_data: np.ndarray) -> bool:
         duration = len(audio_data) / SAMPLE_RATE
         vad_start_time = time.time()
 
+        if len(audio_data) == 0:
+            return False
+
         try:
+            if audio_data.dtype == np.float32 and max(audio_data.max(), -audio_data.min()) < SILENCE_PEAK_THRESHOLD:
+                self.logger.info(f"Silence pre-check: peak below threshold (duration: {duration:.2f}s), skipping TEN VAD")
+                return False
+
             audio_int16 = convert_audio_for_ten_vad(audio_data)
             chunk_size = VAD_CHUNK_SIZE
 
@@ -4,16 +4,23 @@ import threading
 from typing import Optional, Callable
 
 import numpy as np
-from faster_whisper import WhisperModel
+
+from .voice_activity_detection import SAMPLE_RATE
 
 
 class WhisperEngine:
+    ADAPTIVE_BEAM_MAX_SAMPLES = 3 * SAMPLE_RATE
+    WITHOUT_TIMESTAMPS_MAX_SAMPLES = 30 * SAMPLE_RATE  # Longer audio needs timestamps to seek between windows
+
     def __init__(self,
                  model_key: str = "tiny",
                  device: str = "cpu",
                  compute_type: str = "int8",
+                 cpu_threads: int = 0,
                  language: str = None,
                  beam_size: int = 5,
+                 adaptive_beam: bool = False,
+                 vad_filter: bool = False,
                  initial_prompt: str = "",
                  hotwords: list = None,
                  vad_manager = None,
@@ -23,8 +30,11 @@ class WhisperEngine:
         self.model_key = model_key
         self.device = device
         self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
         self.language = None if language == 'auto' else language
         self.beam_size = beam_size
+        self.adaptive_beam = adaptive_beam
+        self.vad_filter = vad_filter
         self.initial_prompt = initial_prompt or None
         self.hotwords = ", ".join(hotwords) if hotwords else None
         self.model = None
@@ -38,6 +48,7 @@ class WhisperEngine:
         self.vad_manager = vad_manager
 
         self._load_model()
+        threading.Thread(target=self.warm_up, daemon=True).start()
     
     def _get_model_source(self, model_key: str) -> str:
         if self.registry:
@@ -52,6 +63,8 @@ class WhisperEngine:
         return False
 
     def _load_model(self):
+        from faster_whisper import WhisperModel
+
         try:
             print(f"🧠 Loading Whisper AI model [{self.model_key}]...")
 
@@ -63,7 +76,8 @@ class WhisperEngine:
             self.model = WhisperModel(
                 model_source,
                 device=self.device,
-                compute_type=self.compute_type
+                compute_type=self.compute_type,
+                cpu_threads=self.cpu_threads
             )
 
             if not was_cached:
@@ -74,13 +88,15 @@ class WhisperEngine:
             print(f"   ✓ Running on {device_label} with {self.compute_type} precision")
 
         except Exception as e:
-            self.logger.error(f"Failed to load Whisper model: {e}")
+            self.logger.error("Failed to load Whisper model: %s", e)
             raise
     
     def _load_model_async(self,
                           new_model_key: str,
                           progress_callback: Optional[Callable[[str], None]] = None):
         def _background_loader():
+            from faster_whisper import WhisperModel
+
             try:
                 if progress_callback:
                     progress_callback("Checking model cache...")
@@ -94,25 +110,27 @@ class WhisperEngine:
                     else:
                         progress_callback("Downloading model...")
 
-                self.logger.info(f"Loading Whisper model: {new_model_key} (async)")
+                self.logger.info("Loading Whisper model: %s (async)", new_model_key)
 
                 model_source = self._get_model_source(new_model_key)
                 new_model = WhisperModel(
                     model_source,
                     device=self.device,
-                    compute_type=self.compute_type
+                    compute_type=self.compute_type,
+                    cpu_threads=self.cpu_threads
                 )
                 self.model = new_model
 
                 self.model_key = new_model_key
-                self.logger.info(f"Whisper model [{new_model_key}] loaded successfully (async)")
+                self.logger.info("Whisper model [%s] loaded successfully (async)", new_model_key)
+                self.warm_up()
 
                 if progress_callback:
                     progress_callback("Model ready!")
 
             except Exception as e:
                 self.model_key = old_model_key
-                self.logger.error(f"Failed to load Whisper model async: {e}")
+                self.logger.error("Failed to load Whisper model async: %s", e)
                 if progress_callback:
                     progress_callback(f"Failed to load model: {e}")
                 raise
@@ -130,6 +148,19 @@ class WhisperEngine:
     
     def is_loading(self) -> bool:
         return self._loading_thread is not None and self._loading_thread.is_alive()
+
+    def warm_up(self):
+        if self.model is None:
+            return
+
+        try:
+            silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+            segments, _ = self.model.transcribe(silence, beam_size=1, language=self.language or "en", without_timestamps=True)
+            for _ in segments:
+                pass
+            self.logger.info("Whisper model [%s] warmed up", self.model_key)
+        except Exception as e:
+            self.logger.warning("Whisper model warm-up failed: %s", e)
     
 
     def transcribe_audio(self,
@@ -150,44 +181,49 @@ class WhisperEngine:
                 print("   ✗ No speech detected, skipping transcription")
                 return None
                        
-            start_time = time.time() # Time transcription for user feedback
+            start_time = time.perf_counter() # Time transcription for user feedback
             
             # Prep audio for faster-whisper
-            if len(audio_data.shape) > 1:
-                audio_data = audio_data.flatten()
+            if audio_data.ndim > 1:
+                audio_data = audio_data.reshape(-1)
             
-            audio_data = audio_data.astype(np.float32)
+            if audio_data.dtype != np.float32:
+                audio_data = audio_data.astype(np.float32)
             
+            beam_size = self.beam_size
+            if self.adaptive_beam and len(audio_data) < self.ADAPTIVE_BEAM_MAX_SAMPLES:
+                beam_size = 1
+
             transcribe_kwargs = dict(
-                beam_size=self.beam_size,
+                beam_size=beam_size,
                 language=self.language,
                 condition_on_previous_text=False,
+                without_timestamps=len(audio_data) <= self.WITHOUT_TIMESTAMPS_MAX_SAMPLES,
             )
             if self.initial_prompt:
                 transcribe_kwargs["initial_prompt"] = self.initial_prompt
             if self.hotwords:
                 transcribe_kwargs["hotwords"] = self.hotwords
+            if self.vad_filter:
+                transcribe_kwargs["vad_filter"] = True
+                transcribe_kwargs["vad_parameters"] = dict(min_silence_duration_ms=300)
 
             segments, info = self.model.transcribe(audio_data, **transcribe_kwargs)
             
-            transcribed_text = ""
-            for segment in segments:
-                transcribed_text += segment.text
-            
-            transcribed_text = transcribed_text.strip()
+            transcribed_text = "".join(segment.text for segment in segments).strip()
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             transcription_time = end_time - start_time
             print(f"   ✓ Transcription completed in {transcription_time:.1f} seconds")
             
             # Log some info about what we transcribed
             detected_language = info.language
             confidence = info.language_probability
-            self.logger.info(f"Transcription complete. Language: {detected_language} (confidence: {confidence:.2f}) - Time: {transcription_time:.2f}s")
+            self.logger.info("Transcription complete. Language: %s (confidence: %.2f) - Time: %.2fs", detected_language, confidence, transcription_time)
             if self.log_transcriptions:
-                self.logger.info(f"Transcribed text: '{transcribed_text}'")
+                self.logger.info("Transcribed text: '%s'", transcribed_text)
             else:
-                self.logger.info(f"Transcribed {len(transcribed_text)} chars")
+                self.logger.info("Transcribed %s chars", len(transcribed_text))
             
             if transcribed_text:
                 print(f"   ✓ Transcribed: '{transcribed_text}'")
@@ -197,7 +233,7 @@ class WhisperEngine:
                 return None
                 
         except Exception as e:
-            self.logger.error(f"Transcription failed: {e}")
+            self.logger.error("Transcription failed: %s", e)
             return None
     
     